@@ -6,6 +6,51 @@ import numpy as np
 import pandas as pd
 from .preprocessing import MeanCentering
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to plain NumPy.
+    njit = None
+
+
+def _pca_eigh_kernel(cov):
+    """Eigendecomposition kernel, written to be Numba-compilable."""
+    values, vectors = np.linalg.eigh(cov)
+    order = np.argsort(values)[::-1]
+    values = values[order].copy()
+    vectors = vectors[:, order].T.copy()
+
+    for i in range(vectors.shape[0]):
+        row = vectors[i]
+        if row[np.abs(row).argmax()] < 0:
+            vectors[i] = -row
+
+    return values, vectors
+
+
+if njit is not None:
+    _pca_eigh_kernel = njit(cache=True)(_pca_eigh_kernel)
+
+
+def _pca_eigh(cov):
+    """Symmetric eigendecomposition sorted by descending eigenvalue.
+
+    Uses `numpy.linalg.eigh` (cheaper than the general `eig` path for a
+    symmetric covariance matrix) and fixes the sign of each eigenvector so
+    that its largest-magnitude component is positive. When Numba is
+    installed the kernel is JIT-compiled (with on-disk caching), which
+    trims the per-call Python overhead when PCA is fitted over many
+    regions; otherwise the plain NumPy version runs.
+
+    Args:
+        cov (np.ndarray): Symmetric P x P covariance matrix.
+
+    Returns:
+        tuple: `(eigen_values, eigen_vectors)` where `eigen_values` has shape
+        (P,) in descending order and the rows of `eigen_vectors` are the
+        matching eigenvectors.
+    """
+    return _pca_eigh_kernel(np.ascontiguousarray(cov, dtype=np.float64))
+
 
 class PCA:
     """
@@ -36,42 +81,106 @@ class PCA:
         self.image = image
         self.region = region
         self.scale = scale
-        self._max_pixels = max_pixels
 
+        # Wrap call parameters as server-side primitives once, so repeated
+        # reduceRegion calls reuse the same objects.
+        self._scale = ee.Number(scale)
+        self._max_pixels = ee.Number(max_pixels)
+
+        # Opt-in centering helper; the PCA pipeline itself centers with the
+        # means from its own shared reduction.
         self._scaler = MeanCentering(self.image, self.region, self.scale)
-        self.centered_image = self._scaler.transform()
 
+        self._centered_image = None  # Lazily computed by the property below
+        self._components = {}  # Cached PC images, keyed by eigen path
         self._eigen_values = None  # For storing eigenvalues for variance computation
         self._pc_names = None  # Names of the principal components
 
-    def get_principal_components(self) -> ee.Image:
+    @property
+    def centered_image(self) -> ee.Image:
+        """Mean-centered input image, computed lazily and cached.
+
+        Construction of a PCA object does no server-side work; the centering
+        graph is only built if this property (or a fit) is actually used.
+        """
+        if self._centered_image is None:
+            self._centered_image = self._scaler.transform()
+        return self._centered_image
+
+    def get_principal_components(self, client_eigen: bool = False) -> ee.Image:
         """Computes normalized principal components of the image.
 
+        Args:
+            client_eigen (bool, optional): If True, pull the (small) P x P
+                covariance matrix client-side and decompose it with
+                `numpy.linalg.eigh` instead of the general `ee.Array.eigen()`.
+                The transfer is negligible and `eigh` exploits symmetry, which
+                pays off for images with many bands (roughly > 30); for small
+                band counts the server-side `eigen()` default is fine. Results
+                are cached per flag value, since the client path applies a
+                deterministic eigenvector sign convention that `eigen()` does
+                not guarantee.
+
         Returns:
             ee.Image: Image with bands ['pc1', 'pc2', ..., 'pcN'] representing normalized PCs.
         """
-        arrays = self.centered_image.toArray()
-
-        covar = arrays.reduceRegion(
-            reducer=ee.Reducer.centeredCovariance(),
+        if client_eigen in self._components:
+            return self._components[client_eigen]
+
+        arrays = self.image.toArray()
+
+        # One shared-inputs pass yields both the band means (for centering the
+        # projection) and the covariance; ee.Reducer.covariance() centers
+        # internally. The mean reducer consumes numbers, so it needs
+        # forEachElement() to run element-wise over the 1-D array pixels.
+        # Keys are '<band>_<output>' on the 'array' band.
+        stats = arrays.reduceRegion(
+            reducer=ee.Reducer.mean()
+            .forEachElement()
+            .combine(ee.Reducer.covariance(), sharedInputs=True),
             geometry=self.region,
-            scale=self.scale,
+            scale=self._scale,
             maxPixels=self._max_pixels,
         )
 
-        if covar is None or covar.get("array") is None:
-            raise RuntimeError(
-                "Covariance matrix could not be computed. Check region/image coverage."
-            )
+        mean_array = ee.Array(stats.get("array_mean"))
+        covar_array = ee.Array(stats.get("array_array"))
+
+        if client_eigen:
+            values, vectors = _pca_eigh(np.array(covar_array.getInfo()))
+            eigen_values = ee.Array(values.reshape(-1, 1).tolist())
+            eigen_vectors = ee.Array(vectors.tolist())
+        else:
+            eigen = covar_array.eigen()
+            eigen_values = eigen.slice(1, 0, 1)
+            eigen_vectors = eigen.slice(1, 1)
+
+        return self._project_components(
+            eigen_values, eigen_vectors, mean_array, cache_key=client_eigen
+        )
+
+    def _project_components(
+        self, eigen_values, eigen_vectors, mean_array, cache_key
+    ) -> ee.Image:
+        """Projects the mean-centered image onto the eigenvectors.
 
-        covar_array = ee.Array(covar.get("array"))
-        eigens = covar_array.eigen()
-        eigen_values = eigens.slice(1, 0, 1)
-        eigen_vectors = eigens.slice(1, 1)
+        Args:
+            eigen_values (ee.Array): Eigenvalues as a (P, 1) column array.
+            eigen_vectors (ee.Array): Eigenvectors as the rows of a P x P array.
+            mean_array (ee.Array): Band means as a length-P array.
+            cache_key (bool | str): `_components` cache slot to fill; True or
+                False for the single-shot client/server eigen paths,
+                'incremental' for the tiled fit.
 
+        Returns:
+            ee.Image: Image with bands ['pc1', ..., 'pcN'] of normalized PCs.
+        """
         self._eigen_values = eigen_values  # Save for explained variance calculation
 
-        array_image = arrays.toArray(1)
+        # Center the projection inputs server-side with the means from the
+        # shared reduction — no separate mean reduceRegion is issued.
+        centered_arrays = self.image.toArray().subtract(ee.Image(mean_array))
+        array_image = centered_arrays.toArray(1)
         principal_components = ee.Image(eigen_vectors).matrixMultiply(array_image)
 
         band_count = self.image.bandNames().size()
@@ -90,8 +199,148 @@ class PCA:
             .divide(sd_image)
         )
 
+        self._components[cache_key] = pc_image  # Makes repeated fits idempotent
         return pc_image
 
+    def fit_incremental(
+        self, tile_size_m: float = 50000, batch_size: int = 8
+    ) -> ee.Image:
+        """Fits the PCA incrementally by accumulating statistics over tiles.
+
+        The region is split into a covering grid and each tile contributes its
+        pixel count, band sums and sum of per-pixel outer products through a
+        single combined `reduceRegion`. Tile statistics are merged client-side
+        into a running mean and covariance (Chan/Welford update), so only a
+        P x P matrix is ever held in one reduction — this fits AOIs that are
+        too large for a single `reduceRegion` without `bestEffort`
+        downsampling. The final eigendecomposition of the accumulated
+        covariance runs client-side with `numpy.linalg.eigh`.
+
+        Args:
+            tile_size_m (float, optional): Tile edge length of the covering
+                grid in meters. Defaults to 50000.
+            batch_size (int, optional): Number of tiles fetched per server
+                round-trip, analogous to sklearn's `IncrementalPCA` batch
+                size. Defaults to 8.
+
+        Returns:
+            ee.Image: Image with bands ['pc1', ..., 'pcN'] of normalized PCs.
+
+        Raises:
+            RuntimeError: If no tile contains valid pixels.
+        """
+        projection = self.image.select(0).projection()
+        grid = self.region.coveringGrid(projection, tile_size_m)
+        tiles = grid.toList(grid.size())
+        n_tiles = grid.size().getInfo()
+
+        vectors = self.image.toArray()
+        columns = vectors.toArray(1)
+        # Per-pixel outer product x x^T; summing it gives the exact second
+        # moment, with no dependence on a covariance reducer's (undocumented)
+        # normalization convention.
+        outer = columns.matrixMultiply(columns.arrayTranspose())
+        inputs = vectors.addBands(outer)
+
+        # count/sum consume numbers, so they run element-wise over the
+        # vector band (shared inputs); the second sum reduces the
+        # outer-product band and is renamed to avoid an output clash.
+        reducer = (
+            ee.Reducer.count()
+            .forEachElement()
+            .combine(ee.Reducer.sum().forEachElement(), sharedInputs=True)
+            .combine(
+                ee.Reducer.sum().forEachElement().setOutputs(["moment"]),
+                sharedInputs=False,
+            )
+        )
+
+        def tile_stats(feature):
+            stats = inputs.reduceRegion(
+                reducer=reducer,
+                geometry=ee.Feature(feature).geometry(),
+                scale=self._scale,
+                bestEffort=True,
+                maxPixels=self._max_pixels,
+            )
+            return ee.Feature(None, stats)
+
+        n_total = 0
+        mean = None
+        scatter = None  # Running centered scatter matrix (n * covariance).
+
+        for start in range(0, n_tiles, batch_size):
+            batch = ee.FeatureCollection(tiles.slice(start, start + batch_size))
+            features = batch.map(tile_stats).getInfo()["features"]
+
+            for feature in features:
+                props = feature["properties"]
+                count = self._tile_prop(props, "count")
+                sums = self._tile_prop(props, "sum")
+                moment = self._tile_prop(props, "moment")
+
+                if not count:
+                    continue
+
+                # The element-wise count is a length-P array whose entries all
+                # equal the tile's pixel count (array pixels mask as a whole).
+                n_tile = int(count[0])
+                if n_tile == 0:
+                    continue
+
+                sums_vec = np.asarray(sums, dtype=float)
+                tile_mean = sums_vec / n_tile
+                # Centered scatter from the exact sums: sum(x x^T) - s s^T / n.
+                tile_scatter = np.asarray(moment, dtype=float) - (
+                    np.outer(sums_vec, sums_vec) / n_tile
+                )
+
+                if mean is None:
+                    n_total, mean, scatter = n_tile, tile_mean, tile_scatter
+                else:
+                    delta = tile_mean - mean
+                    n_new = n_total + n_tile
+                    scatter = (
+                        scatter
+                        + tile_scatter
+                        + np.outer(delta, delta) * (n_total * n_tile / n_new)
+                    )
+                    mean = mean + delta * (n_tile / n_new)
+                    n_total = n_new
+
+        if mean is None or n_total < 2:
+            raise RuntimeError(
+                "Incremental fit found no valid pixels. Check region/image coverage."
+            )
+
+        covariance = scatter / (n_total - 1)
+        values, vectors = _pca_eigh(covariance)
+
+        eigen_values = ee.Array(values.reshape(-1, 1).tolist())
+        eigen_vectors = ee.Array(vectors.tolist())
+        mean_array = ee.Array(mean.tolist())
+
+        # The tiled (bestEffort-per-tile) estimate is not interchangeable with
+        # the single-shot fits, so it gets its own cache slot.
+        return self._project_components(
+            eigen_values, eigen_vectors, mean_array, cache_key="incremental"
+        )
+
+    @staticmethod
+    def _tile_prop(props, name):
+        """Fetches a reducer output from tile properties.
+
+        Prefers the exact output name and falls back to a '<band>_<name>'
+        suffix match, since reducers may prefix outputs with the input band
+        name.
+        """
+        if name in props:
+            return props[name]
+        for key, value in props.items():
+            if key.endswith(f"_{name}"):
+                return value
+        return None
+
     def get_explained_variance(self) -> pd.DataFrame:
         """Returns explained variance ratio for each principal component.
 
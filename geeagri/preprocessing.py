@@ -1,5 +1,7 @@
 """Module for preprocessing Earth Observation data using Google Earth Engine."""
 
+from dataclasses import dataclass
+
 import ee
 
 
@@ -174,27 +176,184 @@ class Sentinel2CloudMask:
         )
 
 
-class MeanCentering:
-    r"""
-    Mean-centers each band of an Earth Engine image.
+@dataclass
+class Stats:
+    """
+    Precomputed region statistics shared across the scalers.
 
-    The transformation is computed as:
+    Wraps the dictionary returned by the combined reducer in `fit_all()` so
+    that several scalers (or other callers) can build their constant stat
+    images without re-reducing the same region.
 
-    $$
-    X_{centered} = X - \mu
-    $$
+    Attributes:
+        stats (ee.Dictionary): Combined reducer outputs keyed '<band>_<stat>'.
+        lower (int): Lower percentile included in the reduction.
+        upper (int): Upper percentile included in the reduction.
+    """
 
-    Where:
+    stats: ee.Dictionary
+    lower: int = 25
+    upper: int = 75
 
-    - $X$: original pixel value
-    - $\mu$: mean of the band computed over the given region
+    def _stat_img(self, bands: ee.List, suffix: str) -> ee.Image:
+        """Builds a constant image for one statistic, renamed to `bands`."""
+        return self.stats.toImage(bands.map(lambda b: ee.String(b).cat(suffix))).rename(
+            bands
+        )
+
+    def mean_img(self, bands: ee.List) -> ee.Image:
+        """Constant image of band means."""
+        return self._stat_img(bands, "_mean")
+
+    def std_img(self, bands: ee.List) -> ee.Image:
+        """Constant image of band standard deviations."""
+        return self._stat_img(bands, "_stdDev")
+
+    def min_img(self, bands: ee.List) -> ee.Image:
+        """Constant image of band minima."""
+        return self._stat_img(bands, "_min")
+
+    def max_img(self, bands: ee.List) -> ee.Image:
+        """Constant image of band maxima."""
+        return self._stat_img(bands, "_max")
+
+    def percentile_img(self, bands: ee.List, percentile: int) -> ee.Image:
+        """Constant image of one band percentile (e.g., 25)."""
+        return self._stat_img(bands, f"_p{percentile}")
+
+
+def _make_fit_all_reducer(lower: int, upper: int) -> ee.Reducer:
+    """Builds the shared-inputs reducer covering every scaler's statistics."""
+    return (
+        ee.Reducer.mean()
+        .combine(ee.Reducer.stdDev(), sharedInputs=True)
+        .combine(ee.Reducer.minMax(), sharedInputs=True)
+        .combine(ee.Reducer.percentile([lower, upper]), sharedInputs=True)
+    )
+
+
+def fit_all(
+    image: ee.Image,
+    region: ee.Geometry,
+    scale: int = 100,
+    lower: int = 25,
+    upper: int = 75,
+    max_pixels: int = int(1e9),
+) -> Stats:
+    """
+    Computes the statistics required by every scaler in a single reduction.
+
+    Combines the mean, stdDev, minMax and percentile reducers with shared
+    inputs so the region is traversed once, instead of once per scaler. The
+    result can be passed to any scaler via `precomputed_stats` to skip its
+    own `reduceRegion`.
 
     Args:
-        image (ee.Image): Input multi-band image to center.
+        image (ee.Image): Input multi-band image.
         region (ee.Geometry): Geometry over which statistics will be computed.
         scale (int, optional): Spatial resolution in meters. Defaults to 100.
+        lower (int, optional): Lower percentile for RobustScaler. Defaults to 25.
+        upper (int, optional): Upper percentile for RobustScaler. Defaults to 75.
         max_pixels (int, optional): Max pixels allowed in computation. Defaults to 1e9.
 
+    Returns:
+        Stats: Precomputed statistics usable by all scalers.
+
+    Raises:
+        TypeError: If image or region is not an ee.Image or ee.Geometry.
+    """
+    if not isinstance(image, ee.Image):
+        raise TypeError("Expected 'image' to be of type ee.Image.")
+    if not isinstance(region, ee.Geometry):
+        raise TypeError("Expected 'region' to be of type ee.Geometry.")
+
+    stats = image.reduceRegion(
+        reducer=_make_fit_all_reducer(lower, upper),
+        geometry=region,
+        scale=scale,
+        bestEffort=True,
+        maxPixels=max_pixels,
+    )
+
+    return Stats(stats=stats, lower=lower, upper=upper)
+
+
+def fit_many(
+    image: ee.Image,
+    regions,
+    scale: int = 100,
+    lower: int = 25,
+    upper: int = 75,
+    max_pixels: int = int(1e9),
+) -> list:
+    """
+    Fits scaler statistics for many regions in one server round-trip.
+
+    Looping `StandardScaler(image, region).transform()` over many field
+    polygons blocks on one `reduceRegion` per region. Here the regions are
+    wrapped in a FeatureCollection, the combined `fit_all()` reducer is
+    mapped over them server-side, and all statistics come back in a single
+    aggregation call — N round-trips collapse into one.
+
+    Args:
+        image (ee.Image): Input multi-band image.
+        regions (list[ee.Geometry] | ee.FeatureCollection): Regions to fit.
+        scale (int, optional): Spatial resolution in meters. Defaults to 100.
+        lower (int, optional): Lower percentile for RobustScaler. Defaults to 25.
+        upper (int, optional): Upper percentile for RobustScaler. Defaults to 75.
+        max_pixels (int, optional): Max pixels allowed in computation. Defaults to 1e9.
+
+    Returns:
+        list[Stats]: Precomputed statistics per region, in input order; pass
+        each to a scaler via `precomputed_stats`.
+
+    Raises:
+        TypeError: If `image` is not an ee.Image.
+    """
+    if not isinstance(image, ee.Image):
+        raise TypeError("Expected 'image' to be of type ee.Image.")
+
+    if isinstance(regions, ee.FeatureCollection):
+        collection = regions
+    else:
+        collection = ee.FeatureCollection([ee.Feature(g) for g in regions])
+
+    reducer = _make_fit_all_reducer(lower, upper)
+
+    def region_stats(feature):
+        stats = image.reduceRegion(
+            reducer=reducer,
+            geometry=feature.geometry(),
+            scale=scale,
+            bestEffort=True,
+            maxPixels=max_pixels,
+        )
+        return ee.Feature(None, stats)
+
+    features = collection.map(region_stats).getInfo()["features"]
+
+    return [
+        Stats(stats=ee.Dictionary(feature["properties"]), lower=lower, upper=upper)
+        for feature in features
+    ]
+
+
+class BaseScaler:
+    """
+    Base class for the band-wise scalers.
+
+    Handles input validation and caches the band names and region statistics
+    so that repeated `transform()` calls only issue a single `reduceRegion`
+    per fitted instance.
+
+    Args:
+        image (ee.Image): Input multi-band image.
+        region (ee.Geometry): Geometry over which statistics will be computed.
+        scale (int, optional): Spatial resolution in meters. Defaults to 100.
+        max_pixels (int, optional): Max pixels allowed in computation. Defaults to 1e9.
+        precomputed_stats (Stats, optional): Statistics from `fit_all()`;
+            when given, the scaler skips its own `reduceRegion`.
+
     Raises:
         TypeError: If image or region is not an ee.Image or ee.Geometry.
     """
@@ -205,6 +364,7 @@ class MeanCentering:
         region: ee.Geometry,
         scale: int = 100,
         max_pixels: int = int(1e9),
+        precomputed_stats: Stats = None,
     ):
         if not isinstance(image, ee.Image):
             raise TypeError("Expected 'image' to be of type ee.Image.")
@@ -216,41 +376,115 @@ class MeanCentering:
         self.scale = scale
         self.max_pixels = max_pixels
 
-    def transform(self) -> ee.Image:
+        # Wrap call parameters as server-side primitives once, so repeated
+        # reduceRegion calls reuse the same objects.
+        self._scale = ee.Number(scale)
+        self._max_pixels = ee.Number(max_pixels)
+
+        self._precomputed = precomputed_stats
+        self._reducer = None
+        self._bands = None
+        self._stats = None
+        self._stat_imgs = {}
+
+    def _make_reducer(self) -> ee.Reducer:
+        """Returns the ee.Reducer used to compute the scaler statistics."""
+        raise NotImplementedError
+
+    def _compute_stats(self) -> None:
+        """Computes and caches band names and region statistics on first use."""
+        if self._stats is None:
+            self._bands = self.image.bandNames()
+            if self._precomputed is not None:
+                self._stats = self._precomputed.stats
+            else:
+                if self._reducer is None:
+                    self._reducer = self._make_reducer()
+                self._stats = self.image.reduceRegion(
+                    reducer=self._reducer,
+                    geometry=self.region,
+                    scale=self._scale,
+                    bestEffort=True,
+                    maxPixels=self._max_pixels,
+                )
+
+    def _stat_img(self, suffix: str) -> ee.Image:
+        """Builds a constant image for one cached statistic, renamed to bands.
+
+        The constant images are memoized per suffix so repeated transforms
+        with the same fitted statistics reuse one subgraph.
         """
-        Applies mean-centering to each band of the image.
+        if suffix not in self._stat_imgs:
+            bands = self._bands
+            self._stat_imgs[suffix] = self._stats.toImage(
+                bands.map(lambda b: ee.String(b).cat(suffix))
+            ).rename(bands)
+        return self._stat_imgs[suffix]
 
-        Returns:
-            ee.Image: The centered image with mean of each band subtracted.
+    def invalidate_cache(self) -> None:
+        """Clears cached band names and statistics (call after changing `image`)."""
+        self._bands = None
+        self._stats = None
+        self._stat_imgs = {}
 
-        Raises:
-            ValueError: If mean computation returns None or missing values.
+
+class MeanCentering(BaseScaler):
+    r"""
+    Mean-centers each band of an Earth Engine image.
+
+    The transformation is computed as:
+
+    $$
+    X_{centered} = X - \mu
+    $$
+
+    Where:
+
+    - $X$: original pixel value
+    - $\mu$: mean of the band computed over the given region
+
+    Args:
+        image (ee.Image): Input multi-band image to center.
+        region (ee.Geometry): Geometry over which statistics will be computed.
+        scale (int, optional): Spatial resolution in meters. Defaults to 100.
+        max_pixels (int, optional): Max pixels allowed in computation. Defaults to 1e9.
+
+    Raises:
+        TypeError: If image or region is not an ee.Image or ee.Geometry.
+    """
+
+    def _make_reducer(self) -> ee.Reducer:
+        return ee.Reducer.mean()
+
+    def transform(self, image: ee.Image = None) -> ee.Image:
         """
-        means = self.image.reduceRegion(
-            reducer=ee.Reducer.mean(),
-            geometry=self.region,
-            scale=self.scale,
-            bestEffort=True,
-            maxPixels=self.max_pixels,
-        )
+        Applies mean-centering to each band of the image.
 
-        if means is None:
-            raise ValueError("Mean computation failed — no valid pixels in the region.")
+        Args:
+            image (ee.Image, optional): Image to center with the fitted
+                statistics. Must share the fitted image's band names.
+                Defaults to the fitted image.
 
-        bands = self.image.bandNames()
+        Returns:
+            ee.Image: The centered image with mean of each band subtracted.
+        """
+        self._compute_stats()
+        image = self.image if image is None else image
 
-        def center_band(band):
-            band = ee.String(band)
-            mean = ee.Number(means.get(band))
-            if mean is None:
-                raise ValueError(f"Mean value not found for band: {band.getInfo()}")
-            return self.image.select(band).subtract(mean).rename(band)
+        # Vectorized arithmetic: one subtract node instead of a per-band map.
+        # The bare mean reducer keys stats by band name; fit_all() keys them
+        # with a '_mean' suffix.
+        suffix = "_mean" if self._precomputed is not None else ""
+        means_img = self._stat_img(suffix)
 
-        centered = bands.map(center_band)
-        return ee.ImageCollection(centered).toBands().rename(bands)
+        # Subtracting a float64 constant would promote the whole image to
+        # double; float32 halves the bytes per pixel downstream. Integer
+        # inputs with bounded centered values can be cast further (e.g.
+        # toInt16()) by the caller if precision allows.
+        return image.subtract(means_img).toFloat()
 
 
-class MinMaxScaler:
+class MinMaxScaler(BaseScaler):
     r"""
     Applies min-max normalization to each band of an Earth Engine image.
 
@@ -276,66 +510,42 @@ class MinMaxScaler:
         TypeError: If `image` is not an `ee.Image` or `region` is not an `ee.Geometry`.
     """
 
-    def __init__(
-        self,
-        image: ee.Image,
-        region: ee.Geometry,
-        scale: int = 100,
-        max_pixels: int = int(1e9),
-    ):
-        if not isinstance(image, ee.Image):
-            raise TypeError("Expected 'image' to be of type ee.Image.")
-        if not isinstance(region, ee.Geometry):
-            raise TypeError("Expected 'region' to be of type ee.Geometry.")
+    def _make_reducer(self) -> ee.Reducer:
+        return ee.Reducer.minMax()
 
-        self.image = image
-        self.region = region
-        self.scale = scale
-        self.max_pixels = max_pixels
-
-    def transform(self) -> ee.Image:
+    def transform(self, image: ee.Image = None) -> ee.Image:
         """
         Applies min-max scaling to each band, producing values in the range [0, 1].
 
+        Band minima and maxima come from a single cached `minMax` reduction
+        and are applied as constant images in one subtract/divide.
+
+        Args:
+            image (ee.Image, optional): Image to scale with the fitted
+                statistics. Must share the fitted image's band names.
+                Defaults to the fitted image.
+
         Returns:
             ee.Image: A scaled image with band values clamped between 0 and 1.
-
-        Raises:
-            ValueError: If min or max statistics are unavailable or reduction fails.
         """
-        stats = self.image.reduceRegion(
-            reducer=ee.Reducer.minMax(),
-            geometry=self.region,
-            scale=self.scale,
-            bestEffort=True,
-            maxPixels=self.max_pixels,
+        self._compute_stats()
+        image = self.image if image is None else image
+
+        # One fused expression node (rescale + clamp) instead of separate
+        # subtract/divide/clamp nodes; EE evaluates it in a single pass per
+        # tile. Cast to float32 rather than the implicit float64 promotion.
+        scaled = image.expression(
+            "max(0, min(1, (b - lo) / (hi - lo)))",
+            {
+                "b": image,
+                "lo": self._stat_img("_min"),
+                "hi": self._stat_img("_max"),
+            },
         )
+        return scaled.toFloat().rename(self._bands)
 
-        if stats is None:
-            raise ValueError(
-                "MinMax reduction failed — possibly no valid pixels in region."
-            )
-
-        bands = self.image.bandNames()
-
-        def scale_band(band):
-            band = ee.String(band)
-            min_val = ee.Number(stats.get(band.cat("_min")))
-            max_val = ee.Number(stats.get(band.cat("_max")))
-            if min_val is None or max_val is None:
-                raise ValueError(f"Missing min/max for band: {band.getInfo()}")
-            scaled = (
-                self.image.select(band)
-                .subtract(min_val)
-                .divide(max_val.subtract(min_val))
-            )
-            return scaled.clamp(0, 1).rename(band)
 
-        scaled = bands.map(scale_band)
-        return ee.ImageCollection(scaled).toBands().rename(bands)
-
-
-class StandardScaler:
+class StandardScaler(BaseScaler):
     r"""
     Standardizes each band of an Earth Engine image using z-score normalization.
 
@@ -364,68 +574,34 @@ class StandardScaler:
         TypeError: If `image` is not an `ee.Image` or `region` is not an `ee.Geometry`.
     """
 
-    def __init__(
-        self,
-        image: ee.Image,
-        region: ee.Geometry,
-        scale: int = 100,
-        max_pixels: int = int(1e9),
-    ):
-        if not isinstance(image, ee.Image):
-            raise TypeError("Expected 'image' to be of type ee.Image.")
-        if not isinstance(region, ee.Geometry):
-            raise TypeError("Expected 'region' to be of type ee.Geometry.")
-
-        self.image = image
-        self.region = region
-        self.scale = scale
-        self.max_pixels = max_pixels
+    def _make_reducer(self) -> ee.Reducer:
+        return ee.Reducer.mean().combine(ee.Reducer.stdDev(), sharedInputs=True)
 
-    def transform(self) -> ee.Image:
+    def transform(self, image: ee.Image = None) -> ee.Image:
         """
         Applies z-score normalization to each band.
 
+        Args:
+            image (ee.Image, optional): Image to standardize with the fitted
+                statistics. Must share the fitted image's band names.
+                Defaults to the fitted image.
+
         Returns:
             ee.Image: Standardized image with zero mean and unit variance.
-
-        Raises:
-            ValueError: If statistics could not be computed.
         """
-        means = self.image.reduceRegion(
-            reducer=ee.Reducer.mean(),
-            geometry=self.region,
-            scale=self.scale,
-            bestEffort=True,
-            maxPixels=self.max_pixels,
-        )
-        stds = self.image.reduceRegion(
-            reducer=ee.Reducer.stdDev(),
-            geometry=self.region,
-            scale=self.scale,
-            bestEffort=True,
-            maxPixels=self.max_pixels,
-        )
-
-        if means is None or stds is None:
-            raise ValueError(
-                "Statistic computation failed — check if region has valid pixels."
-            )
-
-        bands = self.image.bandNames()
+        self._compute_stats()
+        image = self.image if image is None else image
 
-        def scale_band(band):
-            band = ee.String(band)
-            mean = ee.Number(means.get(band))
-            std = ee.Number(stds.get(band))
-            if mean is None or std is None:
-                raise ValueError(f"Missing stats for band: {band.getInfo()}")
-            return self.image.select(band).subtract(mean).divide(std).rename(band)
+        # Vectorized arithmetic: one subtract/divide over the whole image
+        # instead of a per-band map.
+        means_img = self._stat_img("_mean")
+        stds_img = self._stat_img("_stdDev")
 
-        scaled = bands.map(scale_band)
-        return ee.ImageCollection(scaled).toBands().rename(bands)
+        # Cast to float32 rather than the implicit float64 promotion.
+        return image.subtract(means_img).divide(stds_img).toFloat()
 
 
-class RobustScaler:
+class RobustScaler(BaseScaler):
     r"""
     Applies robust scaling to each band of an Earth Engine image using percentiles,
     which reduces the influence of outliers compared to min-max scaling.
@@ -452,6 +628,9 @@ class RobustScaler:
         scale (int): Spatial resolution in meters for computation.
         lower (int): Lower percentile to use (default: 25).
         upper (int): Upper percentile to use (default: 75).
+        extra_percentiles (list[int], optional): Additional percentiles to
+            compute in the same reduction (e.g., for clipping or outlier
+            flags); available afterwards through `stats_`.
         max_pixels (int): Maximum number of pixels allowed for region reduction.
 
     Raises:
@@ -465,61 +644,85 @@ class RobustScaler:
         scale: int = 100,
         lower: int = 25,
         upper: int = 75,
+        extra_percentiles: list = None,
         max_pixels: int = int(1e9),
+        precomputed_stats: Stats = None,
     ):
-        if not isinstance(image, ee.Image):
-            raise TypeError("Expected 'image' to be of type ee.Image.")
-        if not isinstance(region, ee.Geometry):
-            raise TypeError("Expected 'region' to be of type ee.Geometry.")
         if not (0 <= lower < upper <= 100):
             raise ValueError("Percentiles must satisfy 0 <= lower < upper <= 100.")
 
-        self.image = image
-        self.region = region
-        self.scale = scale
+        percentiles = sorted(set([lower, upper, *(extra_percentiles or [])]))
+        if not all(0 <= p <= 100 for p in percentiles):
+            raise ValueError("Percentiles must lie between 0 and 100.")
+
+        # fit_all() only computes its own lower/upper percentiles; mismatches
+        # would otherwise surface only server-side as missing '_p<N>' keys.
+        if precomputed_stats is not None:
+            available = {precomputed_stats.lower, precomputed_stats.upper}
+            missing = [p for p in percentiles if p not in available]
+            if missing:
+                raise ValueError(
+                    f"`precomputed_stats` covers percentiles {sorted(available)} "
+                    f"but this scaler needs {missing}; rerun fit_all() with "
+                    "matching lower/upper."
+                )
+
+        super().__init__(
+            image,
+            region,
+            scale=scale,
+            max_pixels=max_pixels,
+            precomputed_stats=precomputed_stats,
+        )
         self.lower = lower
         self.upper = upper
-        self.max_pixels = max_pixels
+        self.percentiles = percentiles
+
+    def _make_reducer(self) -> ee.Reducer:
+        # All requested percentiles plus min/max come from one shared-inputs
+        # pass, so downstream uses (clipping, outlier flags) need no
+        # re-reduction.
+        return ee.Reducer.percentile(self.percentiles).combine(
+            ee.Reducer.minMax(), sharedInputs=True
+        )
 
-    def transform(self) -> ee.Image:
+    @property
+    def stats_(self) -> ee.Dictionary:
+        """Fitted statistics dictionary (all percentiles plus min/max)."""
+        self._compute_stats()
+        return self._stats
+
+    def transform(self, image: ee.Image = None) -> ee.Image:
         """
         Applies percentile-based scaling to each band in the image.
         Values are scaled to the [0, 1] range and clamped.
 
+        Band percentiles come from a single cached reduction and are applied
+        as constant images in one subtract/divide.
+
+        Args:
+            image (ee.Image, optional): Image to scale with the fitted
+                statistics. Must share the fitted image's band names.
+                Defaults to the fitted image.
+
         Returns:
             ee.Image: The scaled image with values between 0 and 1.
-
-        Raises:
-            ValueError: If percentile reduction fails.
         """
-        bands = self.image.bandNames()
-        percentiles = self.image.reduceRegion(
-            reducer=ee.Reducer.percentile([self.lower, self.upper]),
-            geometry=self.region,
-            scale=self.scale,
-            bestEffort=True,
-            maxPixels=self.max_pixels,
+        self._compute_stats()
+        image = self.image if image is None else image
+
+        # One fused expression node (rescale + clamp) instead of separate
+        # subtract/divide/clamp nodes; EE evaluates it in a single pass per
+        # tile. Cast to float32 rather than the implicit float64 promotion.
+        scaled = image.expression(
+            "max(0, min(1, (b - lo) / (hi - lo)))",
+            {
+                "b": image,
+                "lo": self._stat_img(f"_p{self.lower}"),
+                "hi": self._stat_img(f"_p{self.upper}"),
+            },
         )
-
-        if percentiles is None:
-            raise ValueError("Percentile computation failed.")
-
-        def scale_band(band):
-            band = ee.String(band)
-            p_min = ee.Number(percentiles.get(band.cat(f"_p{self.lower}")))
-            p_max = ee.Number(percentiles.get(band.cat(f"_p{self.upper}")))
-            if p_min is None or p_max is None:
-                raise ValueError(
-                    f"Missing percentile values for band: {band.getInfo()}"
-                )
-
-            scaled = (
-                self.image.select(band).subtract(p_min).divide(p_max.subtract(p_min))
-            )
-            return scaled.clamp(0, 1).rename(band)
-
-        scaled = bands.map(scale_band)
-        return ee.ImageCollection(scaled).toBands().rename(bands)
+        return scaled.toFloat().rename(self._bands)
 
 
 class MovingWindowSmoothing: